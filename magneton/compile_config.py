@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Precompile the global config.yaml into a pickle next to it.
+
+    python -m magneton.compile_config [path ...]
+
+The pickle records the (mtime_ns, size) of the YAML it was built from, and
+load_global_config_path only uses it while the YAML still matches exactly.
+"""
+
+import os
+import pickle
+import sys
+
+import yaml
+
+from magneton.yaml_cache import SafeLoader
+
+_DEFAULT_PATHS = ("magneton/config.yaml",)
+
+
+def compile_config(path):
+    """Parse ``path`` and write it, stamped with the YAML's (mtime_ns, size), to ``path + ".pkl"``."""
+    st = os.stat(path)
+    with open(path, "r") as f:
+        cfg = yaml.load(f, Loader=SafeLoader)
+    with open(path + ".pkl", "wb") as f:
+        pickle.dump(
+            {"source": [st.st_mtime_ns, st.st_size], "config": cfg},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    return path + ".pkl"
+
+
+def main(argv=None):
+    paths = (sys.argv[1:] if argv is None else argv) or _DEFAULT_PATHS
+    for path in paths:
+        print(f"[INFO] Compiled: {compile_config(path)}")
+
+
+if __name__ == "__main__":
+    main()
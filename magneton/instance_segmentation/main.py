@@ -10,21 +10,31 @@ Provides:
 """
 
 import argparse
+import contextlib
 import logging
-import shutil
 import os
+import re
 import time
+import types
 import yaml
 import signal
 import threading
 import inspect
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.columns import Columns
 from rich.prompt import Prompt
+from rich.markup import escape
 from rich import box
-import torch
+
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # libyaml not available, fall back to the pure-Python parser
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 console = Console()
 
@@ -34,44 +44,94 @@ from magneton.instance_segmentation.config import (
     load_global_config_path,
 )
 
+from magneton.instance_segmentation.utils.interrupts import InterruptController
+from magneton.compile_config import compile_config
+from magneton.instance_segmentation.state.session import save_session, load_session
+
 # === Pipeline modules ===
-from magneton.instance_segmentation.stages.segmentation_stage import (
-    segmentation_blocks,
-    segmentation_blocks_parallel,
-)
-from magneton.instance_segmentation.stages.segmentation_stage_hpc import segmentation_blocks_hpc
-from magneton.instance_segmentation.stages.merge_pools import build_id_pools_parallel
-from magneton.instance_segmentation.stages.merge_pools_hpc import build_id_pools_parallel_hpc
-from magneton.instance_segmentation.stages.merge_apply import apply_pools_to_global
-from magneton.instance_segmentation.stages.merge_apply_hpc import apply_pools_to_global_hpc
-from magneton.instance_segmentation.state.checkpoint import load_merge_state
+# Stage modules (cloudvolume, waterz, igneous, ...) are imported inside the runners
+# below so the interactive menu starts without loading them.
+def _run_segmentation(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.segmentation_stage import (
+        segmentation_blocks,
+        segmentation_blocks_parallel,
+    )
+    func = segmentation_blocks_parallel if stage_cfg.get("parallel", False) else segmentation_blocks
+    func(cfg, stage_cfg, restart=args.restart)
 
 
-from magneton.instance_segmentation.utils.interrupts import InterruptController
+def _run_segmentation_hpc(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.segmentation_stage_hpc import segmentation_blocks_hpc
+    segmentation_blocks_hpc(cfg, stage_cfg, restart=args.restart, dry_run=False)
+
+
+def _run_merge_pools(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.merge_pools import build_id_pools_parallel
+    build_id_pools_parallel(cfg, stage_cfg, restart=args.restart)
+
+
+def _run_merge_pools_hpc(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.merge_pools_hpc import build_id_pools_parallel_hpc
+    build_id_pools_parallel_hpc(cfg, stage_cfg, restart=args.restart)
+
+
+def _run_merge_apply(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.merge_apply import apply_pools_to_global
+    apply_pools_to_global(cfg, stage_cfg)
+
+
+def _run_merge_apply_hpc(cfg, stage_cfg, args):
+    from magneton.instance_segmentation.stages.merge_apply_hpc import apply_pools_to_global_hpc
+    apply_pools_to_global_hpc(cfg, stage_cfg)
+
+
+# Used for any key missing from the ``instance_segmentation`` section of the global config
+_DEFAULT_CFG_PATHS = {
+    "main": "magneton/instance_segmentation/configs/config.yaml",
+}
+
+# title: shown when confirming; edit_label: shown when editing the config;
+# stage_key: section passed to get_stage_config; func: runner(cfg, stage_cfg, args)
+StageSpec = namedtuple("StageSpec", ["title", "edit_label", "stage_key", "func"])
+
+STAGE_TABLE = {
+    "segmentation": StageSpec("Segmentation", "Segmentation Stage", "segmentation", _run_segmentation),
+    "segmentation-hpc": StageSpec("Segmentation-HPC", "Segmentation-HPC Stage", "segmentation", _run_segmentation_hpc),
+    "merge-pools": StageSpec("Merge-Pools", "Merge-Pools Stage", "merge", _run_merge_pools),
+    "merge-pools-hpc": StageSpec("Merge-Pools-HPC", "Merge-Pools Stage", "merge", _run_merge_pools_hpc),
+    "merge-apply": StageSpec("Merge-Apply", "Merge-Apply Stage", "merge", _run_merge_apply),
+    "merge-apply-hpc": StageSpec("Merge-Apply-HPC", "Merge-Apply Stage", "merge", _run_merge_apply_hpc),
+}
 
 # ==========================================================
 # Unified CLI interface (for package-level use)
 # ==========================================================
-def edit_stage_config(config_path: str, stage_name: str):
-    """Ask user whether to modify stage-specific YAML config before running."""
-    print(f"\nStage: {stage_name}")
-    print(f"Config path: {config_path}")
+# Plain int/float literals typed at the "New value" prompt (e.g. 8, -0.5, 1e-5)
+_NUM_RE = re.compile(r"^[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?$")
 
-    if not os.path.exists(config_path):
-        print(f"Config file not found at {config_path}, skipping modification.")
-        return config_path
-            
-    if not Prompt.ask("[white]> Modify this stage config before running? (y/n)[/white]", default="n").lower().startswith("y"):
-        return config_path
 
-    # Read configuration file
-    with open(config_path, "r") as f:
-        cfg_data = yaml.safe_load(f)
+def _coerce_number(value: str):
+    """Convert a numeric-looking string to int/float; anything else is returned unchanged."""
+    if not _NUM_RE.match(value):
+        return value
+    if any(c in value for c in ".eE"):
+        return float(value)
+    return int(value)
 
-    # Display Configuration Items (Single Layer)
-    flat_keys = []
-    flat_sections = []
-    print("\nAvailable parameters in config:")
+
+def _iter_flat(cfg):
+    """Yield (section, key, container) for every editable leaf; container[key] is the value."""
+    for section, sub in cfg.items():
+        if isinstance(sub, dict):
+            for k in sub:
+                yield section, k, sub
+        else:
+            yield section, section, cfg
+
+
+def _render_config_table(entries):
+    """Build the Index/Section/Parameter/Value table for (section, key, container) entries."""
+    rows = [(str(i), str(sec), str(k), f"[cyan]{c[k]}[/cyan]") for i, (sec, k, c) in enumerate(entries, 1)]
     config_table = Table(
             box=box.SIMPLE,
             title_style="bold bright_white",
@@ -82,90 +142,124 @@ def edit_stage_config(config_path: str, stage_name: str):
     config_table.add_column("Section", style="white")
     config_table.add_column("Parameter", style="white")
     config_table.add_column("Value", style="white")
+    for row in rows:
+        config_table.add_row(*row)
+    return config_table
+
+
+def confirm_stage(stage_name):
+    """Ask before starting a stage; returns False if the user types 'q'."""
+    resp = Prompt.ask(
+        f"\nStarting stage: {escape(stage_name)}\nPress Enter to continue or type 'q' to cancel",
+        choices=["", "q"],
+        default="",
+        case_sensitive=False,
+        show_choices=False,
+        show_default=False,
+    )
+    if resp == "q":
+        console.print(f"[bold red]▶ Canceled stage: {escape(stage_name)}.[/bold red]\n")
+        return False
+    return True
 
-    i = 1
 
-    for section, sub in cfg_data.items():
-        # console.print(f"[bold]{section}[/bold]:")
-        
-        if isinstance(sub, dict):
-            for k, v in sub.items():
-                # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                flat_keys.append(k)
-                flat_sections.append(section)
-                config_table.add_row(f"{i}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                i += 1
-        else:
-            # console.print(f"   - [cyan]{sub}[/cyan]")
-            flat_keys.append(section)
-            flat_sections.append(section)
-            config_table.add_row(f"{i}", f"{section}", f"{section}",  f"[cyan]{sub}[/cyan]")
-            i += 1
-        
-    console.print(config_table)
+def _pause_return():
+    """Block until the user presses Enter to go back to the menu."""
+    Prompt.ask("Press Enter to return menu", default="", show_default=False)
+
+
+def edit_stage_config(config_path: str, stage_name: str):
+    """Ask user whether to modify stage-specific YAML config before running."""
+    console.print(f"\nStage: {escape(stage_name)}\nConfig path: {escape(config_path)}")
+
+    if not os.path.exists(config_path):
+        console.print(f"Config file not found at {escape(config_path)}, skipping modification.")
+        return config_path
+            
+    if not Prompt.ask("[white]> Modify this stage config before running? (y/n)[/white]", default="n").lower().startswith("y"):
+        return config_path
+
+    # Read configuration file
+    with open(config_path, "r") as f:
+        cfg_data = yaml.load(f, Loader=_SafeLoader)
 
-    # idx = 1
-    # for k, v in cfg_data.items():
-    #     print(f"{idx}. {k}: {v}")
-    #     flat_keys.append(k)
-    #     idx += 1
+    # Display Configuration Items (Single Layer)
+    console.print("\nAvailable parameters in config:")
+    entries = list(_iter_flat(cfg_data))
+    console.print(_render_config_table(entries))
 
+    dirty = False
     while True:
         choice = input("> Select parameter to modify (number, or ENTER to finish): ").strip()
         if choice == "":
             break
-        if not choice.isdigit() or not (1 <= int(choice) <= len(flat_keys)):
-            print("Invalid selection.")
+        idx = int(choice) if choice.isdigit() else 0
+        if not (1 <= idx <= len(entries)):
+            console.print("[red]Invalid selection.[/red]")
             continue
 
-        key = flat_keys[int(choice) - 1]
-        section_key = flat_sections[int(choice) - 1]
-        if key == section_key:
-            old_val = cfg_data[section_key]
-            print(f"Current value for {section_key}/{key}: {old_val}")
-            new_val = input("New value: ").strip()
-            if new_val == "":
-                print("No change made.")
-                continue
-
-            # Automatic Type Conversion (int/float)
-            try:
-                if "." in new_val:
-                    new_val = float(new_val)
-                else:
-                    new_val = int(new_val)
-            except ValueError:
-                pass
+        section_key, key, container = entries[idx - 1]
+        # Current value and the prompt go out as one write
+        new_val = input(f"Current value for {section_key}/{key}: {container[key]}\nNew value: ").strip()
+        if new_val == "":
+            console.print("No change made.")
+            continue
 
-            cfg_data[section_key] = new_val
-        else:
-            old_val = cfg_data[section_key][key]
-            print(f"Current value for {section_key}/{key}: {old_val}")
-            new_val = input("New value: ").strip()
-            if new_val == "":
-                print("No change made.")
-                continue
-
-            # Automatic Type Conversion (int/float)
-            try:
-                if "." in new_val:
-                    new_val = float(new_val)
-                else:
-                    new_val = int(new_val)
-            except ValueError:
-                pass
+        # Automatic Type Conversion (int/float)
+        new_val = _coerce_number(new_val)
 
-            cfg_data[section_key][key] = new_val
-        print(f"Updated {key} → {new_val}")
+        container[key] = new_val
+        dirty = True
+        console.print(f"Updated {escape(str(key))} → {escape(str(new_val))}")
+
+    # Nothing edited: run with the original file instead of re-serializing it
+    if not dirty:
+        return config_path
 
     # Save to temporary file
     temp_path = config_path + ".tmp"
     with open(temp_path, "w") as f:
-        yaml.safe_dump(cfg_data, f, sort_keys=False)
-    print(f"Temporary modified config saved: {temp_path}")
+        yaml.dump(cfg_data, f, Dumper=_SafeDumper, sort_keys=False)
+    console.print(f"Temporary modified config saved: {escape(temp_path)}")
 
     return temp_path
 
+# Above this many finished blocks the status stage prints a summary instead of every name
+_STATUS_LIST_LIMIT = 1000
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree via os.scandir, reusing the dir-entry type instead of an lstat per file.
+
+    A symlinked top-level folder (e.g. checkpoints on scratch) has its target emptied and the link kept,
+    so the next run writes back into the same target; links found inside are unlinked, never followed.
+    """
+    keep_dir = os.path.islink(path)
+    # Entries may vanish underneath us when the cleaned folders are nested, so tolerate that
+    with contextlib.suppress(FileNotFoundError), os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(entry.path)
+    if keep_dir:
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.rmdir(path)
+
+def _execute_stage(spec, args, seg_cfg_path):
+    """Confirm, optionally edit the config, and run one STAGE_TABLE entry. Returns False if canceled."""
+    if not confirm_stage(spec.title):
+        return False
+    cfg_path = edit_stage_config(seg_cfg_path, spec.edit_label)
+    cfg = load_config(cfg_path)
+    stage_cfg = get_stage_config(cfg, spec.stage_key)
+    with InterruptController():
+        spec.func(cfg, stage_cfg, args)
+    _pause_return()
+    return True
+
 # ------------------------------------------
 # Main
 # ------------------------------------------
@@ -180,93 +274,17 @@ def run(args, global_cfg):
     )
 
     # Resolve config paths
-    seg_cfg_path = (
-        global_cfg.get("instance_segmentation", {})
-        .get("main", "magneton/instance_segmentation/configs/config.yaml")
-    )
-
-    def confirm_stage(stage_name):
-        print(f"\nStarting stage: {stage_name}")
-        print("Press Enter to continue or type 'q' to cancel.")
-        resp = input("> ").strip().lower()
-        if resp == "q":
-            # print(f"Canceled stage: {stage_name}")
-            console.print(f"[bold red]▶ Canceled stage: {stage_name}.[/bold red]\n")
-            return False
-        return True
+    paths = {**_DEFAULT_CFG_PATHS, **(global_cfg.get("instance_segmentation") or {})}
+    seg_cfg_path = paths["main"]
 
     # -----------------------------------
     # Stage logic
     # -----------------------------------
     try:
-        if args.stage == "segmentation":
-            if not confirm_stage("Segmentation"):
-                return
-            cfg_path = edit_stage_config(seg_cfg_path, "Segmentation Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "segmentation")
-            func = segmentation_blocks_parallel if stage_cfg.get("parallel", False) else segmentation_blocks
-            with InterruptController():
-                func(cfg, stage_cfg, restart=args.restart)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
-            # safe_run(func, cfg, stage_cfg, restart=args.restart)
-
-        elif args.stage == "segmentation-hpc":
-            if not confirm_stage("Segmentation-HPC"):
+        spec = STAGE_TABLE.get(args.stage)
+        if spec is not None:
+            if not _execute_stage(spec, args, seg_cfg_path):
                 return
-            cfg_path = edit_stage_config(seg_cfg_path, "Segmentation-HPC Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "segmentation")
-            with InterruptController():
-                segmentation_blocks_hpc(cfg, stage_cfg, restart=args.restart, dry_run=False)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
-            # safe_run(segmentation_blocks_hpc, cfg, stage_cfg, restart=args.restart, dry_run=False)
-
-        elif args.stage == "merge-pools":
-            if not confirm_stage("Merge-Pools"):
-                return
-            cfg_path = edit_stage_config(seg_cfg_path, "Merge-Pools Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "merge")
-            with InterruptController():
-                build_id_pools_parallel(cfg, stage_cfg, restart=args.restart)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
-            # safe_run(build_id_pools_parallel, cfg, stage_cfg, restart=args.restart)
-        elif args.stage == "merge-pools-hpc":
-            if not confirm_stage("Merge-Pools-HPC"):
-                return
-            cfg_path = edit_stage_config(seg_cfg_path, "Merge-Pools Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "merge")
-            with InterruptController():
-                build_id_pools_parallel_hpc(cfg, stage_cfg, restart=args.restart)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
-
-        elif args.stage == "merge-apply":
-            if not confirm_stage("Merge-Apply"):
-                return
-            cfg_path = edit_stage_config(seg_cfg_path, "Merge-Apply Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "merge")
-            with InterruptController():
-                apply_pools_to_global(cfg, stage_cfg)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
-            # safe_run(apply_pools_to_global, cfg, stage_cfg)
-        elif args.stage == "merge-apply-hpc":
-            if not confirm_stage("Merge-Apply-HPC"):
-                return
-            cfg_path = edit_stage_config(seg_cfg_path, "Merge-Apply Stage")
-            cfg = load_config(cfg_path)
-            stage_cfg = get_stage_config(cfg, "merge")
-            with InterruptController():
-                apply_pools_to_global_hpc(cfg, stage_cfg)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
 
         elif args.stage == "status":
             cfg = load_config(seg_cfg_path)
@@ -275,32 +293,40 @@ def run(args, global_cfg):
             if not os.path.exists(folder_done):
                 print("Segmentation state: checkpoint folder not found.")
             else:
-                files = os.listdir(folder_done)
+                with os.scandir(folder_done) as it:
+                    files = sorted(e.name for e in it)
                 if not files:
                     print("Segmentation state: no block done.")
+                elif len(files) > _STATUS_LIST_LIMIT:
+                    console.print(
+                        f"Segmentation state: [green]\\[Done][/green] {len(files)} blocks; "
+                        f"first: {escape(files[0])}, last: {escape(files[-1])}"
+                    )
                 else:
                     print("Segmentation state:")
-                    for f in files:
-                        print(f"[Done] {f}")
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+                    console.print(Columns([f"[green]\\[Done][/green] {escape(f)}" for f in files], expand=True))
+            _pause_return()
                         
         elif args.stage == "clean":
             if not confirm_stage("Clean Temporary Files"):
                 return
             cfg = load_config(seg_cfg_path)
-            for path in [
+            clean_dirs = list(dict.fromkeys([
                 cfg["checkpoint"]["segmentation_dir"],
                 cfg["checkpoint"]["merge_dir"],
                 cfg["segmentation_stage"]["metadata_dir"],
-            ]:
-                if os.path.exists(path):
-                    shutil.rmtree(path)
-                    print(f"[INFO] Cleaned: {path}")
+            ]))
+            # Folders hold thousands of small block files; delete them concurrently
+            with ThreadPoolExecutor(max_workers=len(clean_dirs)) as ex:
+                futures = {p: ex.submit(_fast_rmtree, p) for p in clean_dirs if os.path.lexists(p)}
+            for path in clean_dirs:
+                err = futures[path].exception() if path in futures else None
+                if err is not None:
+                    # Report and carry on so a permission error does not take down the menu
+                    print(f"[ERROR] Could not clean {path}: {err}")
                 else:
                     print(f"[INFO] Cleaned: {path}")
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+            _pause_return()
         
         # return True
         # if stop_flag.is_set():
@@ -319,8 +345,8 @@ def run(args, global_cfg):
 def load_global_config(path="magneton/config.yaml"):
     """Load YAML config file."""
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        # Same loader (and caches) as the CLI path in main()
+        cfg = load_global_config_path(path)
         print(f"\nLoaded global config from: {path}")
         return cfg, path
     except FileNotFoundError:
@@ -331,7 +357,10 @@ def load_global_config(path="magneton/config.yaml"):
 def save_global_config(cfg, path):
     """Save updated YAML config."""
     with open(path, "w") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False)
+        yaml.dump(cfg, f, Dumper=_SafeDumper, sort_keys=False)
+    if os.path.exists(path + ".pkl"):
+        # Keep the compiled copy in step, or every later run would warn that it is stale
+        compile_config(path)
     print(f"Saved updated global config to: {path}")
 
 
@@ -343,69 +372,29 @@ def modify_global_config(cfg, cfg_path):
     # if new_path:
     #     cfg, cfg_path = load_global_config(new_path)
 
-    flat_items = []
-    # print("\nAvailable config parameters:")
-    idx = 1
-    # for section, sub in cfg.items():
-    #     if isinstance(sub, dict):
-    #         for k, v in sub.items():
-    #             flat_items.append((f"{section}/{k}", v))
-    #             print(f"{idx}. {section}/{k}: {v}")
-    #             idx += 1
-    #     else:
-    #         flat_items.append((section, sub))
-    #         print(f"{idx}. {section}: {sub}")
-    #         idx += 1
     console.rule("[bold bright_white]Available Config Parameters[/bold bright_white]", style="bright_cyan")
-    config_table = Table(
-            box=box.SIMPLE,
-            title_style="bold bright_white",
-            header_style="bright_white",
-            show_header=True
-        )
-    config_table.add_column("Index", justify="center", style="white")
-    config_table.add_column("Section", style="white")
-    config_table.add_column("Parameter", style="white")
-    config_table.add_column("Value", style="white")
-
-    for section, sub in cfg.items():
-        # console.print(f"[bold]{section}[/bold]:")
-        if isinstance(sub, dict):
-            for k, v in sub.items():
-                # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                flat_items.append((f"{section}/{k}", v))
-                config_table.add_row(f"{idx}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                idx += 1
-        else:
-            # console.print(f"   - [cyan]{sub}[/cyan]")
-            flat_items.append((section, sub))
-            config_table.add_row("-", "-", "-", f"[cyan]{sub}[/cyan]")
-            idx += 1
-        
-    console.print(config_table)
+    entries = list(_iter_flat(cfg))
+    console.print(_render_config_table(entries))
     while True:
         choice = input("> Select parameter to modify (number, or ENTER to finish): ").strip()
         if choice == "":
             break
-        if not choice.isdigit() or not (1 <= int(choice) <= len(flat_items)):
-            print("Invalid selection.")
+        idx = int(choice) if choice.isdigit() else 0
+        if not (1 <= idx <= len(entries)):
+            console.print("[red]Invalid selection.[/red]")
             continue
 
-        key_path, old_val = flat_items[int(choice) - 1]
-        # print('\n')
-        print(f"Current value for {key_path}: {old_val}")
-        new_val = input("> New value: ").strip()
+        section, key, container = entries[idx - 1]
+        key_path = section if container is cfg else f"{section}/{key}"
+        # Current value and the prompt go out as one write
+        new_val = input(f"Current value for {key_path}: {container[key]}\n> New value: ").strip()
         if new_val == "":
-            print("No change made.")
+            console.print("No change made.")
             continue
 
         # Apply modification
-        parts = key_path.split("/")
-        target = cfg
-        for p in parts[:-1]:
-            target = target[p]
-        target[parts[-1]] = new_val
-        print(f"Updated {key_path} → {new_val}")
+        container[key] = new_val
+        console.print(f"Updated {escape(str(key_path))} → {escape(new_val)}")
 
     if Prompt.ask("[white]> Save changes to file? (y/n)[/white]", default="n").lower().startswith("y"):
         save_global_config(cfg, cfg_path)
@@ -415,6 +404,52 @@ def modify_global_config(cfg, cfg_path):
     return cfg, cfg_path
 
 
+def _build_main_menu():
+    """Build the (static) instance segmentation menu table."""
+    table = Table(show_header=True, box=box.SIMPLE, border_style="white", 
+                  title_style="bold bright_white",header_style="bright_white",)
+    
+    table.add_column("Option", justify="center", style="white")
+    table.add_column("Function", style="white")
+    table.add_column("Description", style="white")
+    table.add_row("1", "Affinity Map Segmentation", "Run affinity map segmentation using local resources")
+    table.add_row("2", "Affinity Map Segmentation [HPC]", "Run affinity map segmentation using HPC resources")
+    table.add_row("3", "Merge Blocks - Pools", "Generate a global ID pool for all segmentated blocks")
+    table.add_row("4", "Merge Blocks - Pools [HPC]", "Generate a global ID pool for all segmentated blocks using HPC resources")
+    
+    table.add_row("5", "Merge Blocks - Apply", "Apply the global ID pool to all segmentated blocks")
+    table.add_row("6", "Merge Blocks - Apply [HPC]", "Apply the global ID pool to all segmentated blocks using HPC resources")
+    
+    table.add_row("7", "Status", "View current segmentation status")
+    table.add_row("8", "Clean", "Remove checkpoints and temp data of segmentation")
+    table.add_row("9", "Modify Global Config", "Modify the global configuration files for each module")
+    table.add_row("10", "View Current Config", "View the global configuration files for each module")
+    table.add_row("0", "Return", "Return to main menu")
+    # table.add_row("h", "Help", "Function description")
+    return table
+
+
+# Static, so built once and re-printed on every menu pass
+_MAIN_MENU_TABLE = _build_main_menu()
+
+_CHOICE_POOL = frozenset(str(i) for i in range(11))
+
+# Menu option -> run() stage
+_STAGE_MAPPING = types.MappingProxyType({
+    "1": "segmentation",
+    "2": "segmentation-hpc",
+    "3": "merge-pools",
+    "4": "merge-pools-hpc",
+    "5": "merge-apply",
+    "6": "merge-apply-hpc",
+    "7": "status",
+    "8": "clean",
+})
+
+# Stages that ask whether to restart from scratch
+_RESTART_STAGES = frozenset({"segmentation", "segmentation-hpc", "merge-pools"})
+
+
 def run_interactive():
     """Interactive CLI mode with styled Rich interface."""
     console.print("\n[bold bright_white] Instance Segmentation Interactive Mode[/bold bright_white]\n")
@@ -422,37 +457,13 @@ def run_interactive():
     cfg_path = "magneton/config.yaml"
     cfg, cfg_path = load_global_config(cfg_path)
 
-    # choice_pool = [str(i) for i in range(10)] + ["h", "help"]
-    choice_pool = [str(i) for i in range(11)]
-
     while True:
         console.rule("[bold bright_white]Instance Segmentation Menu[/bold bright_white]", style="bold white")
 
-        table = Table(show_header=True, box=box.SIMPLE, border_style="white", 
-                      title_style="bold bright_white",header_style="bright_white",)
-        
-        table.add_column("Option", justify="center", style="white")
-        table.add_column("Function", style="white")
-        table.add_column("Description", style="white")
-        table.add_row("1", "Affinity Map Segmentation", "Run affinity map segmentation using local resources")
-        table.add_row("2", "Affinity Map Segmentation [HPC]", "Run affinity map segmentation using HPC resources")
-        table.add_row("3", "Merge Blocks - Pools", "Generate a global ID pool for all segmentated blocks")
-        table.add_row("4", "Merge Blocks - Pools [HPC]", "Generate a global ID pool for all segmentated blocks using HPC resources")
-        
-        table.add_row("5", "Merge Blocks - Apply", "Apply the global ID pool to all segmentated blocks")
-        table.add_row("6", "Merge Blocks - Apply [HPC]", "Apply the global ID pool to all segmentated blocks using HPC resources")
-        
-        table.add_row("7", "Status", "View current segmentation status")
-        table.add_row("8", "Clean", "Remove checkpoints and temp data of segmentation")
-        table.add_row("9", "Modify Global Config", "Modify the global configuration files for each module")
-        table.add_row("10", "View Current Config", "View the global configuration files for each module")
-        table.add_row("0", "Return", "Return to main menu")
-        # table.add_row("h", "Help", "Function description")
-
-        console.print(table)
+        console.print(_MAIN_MENU_TABLE)
 
         choice = Prompt.ask("[bright_white]> Select stage[/bright_white]", default="0").strip().lower()
-        if choice not in choice_pool:
+        if choice not in _CHOICE_POOL:
             console.print("[red]Invalid selection. Try again.[/red]")
             continue
 
@@ -462,62 +473,19 @@ def run_interactive():
 
         if choice == "9":
             cfg, cfg_path = modify_global_config(cfg, cfg_path)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+            _pause_return()
             continue
 
         if choice == "10":
             console.rule("[bold bright_white]Current Global Config[/bold bright_white]", style="bright_cyan")
-            config_table = Table(
-                    box=box.SIMPLE,
-                    title_style="bold bright_white",
-                    header_style="bright_white",
-                    show_header=True
-                )
-            config_table.add_column("Index", justify="center", style="white")
-            config_table.add_column("Section", style="white")
-            config_table.add_column("Parameter", style="white")
-            config_table.add_column("Value", style="white")
-    
-            for section, sub in cfg.items():
-                # console.print(f"[bold]{section}[/bold]:")
-                i = 1
-                if isinstance(sub, dict):
-                    for k, v in sub.items():
-                        # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                        config_table.add_row(f"{i}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                        i += 1
-                else:
-                    # console.print(f"   - [cyan]{sub}[/cyan]")
-                    config_table.add_row("-", "-", "-", f"[cyan]{sub}[/cyan]")
-                    i += 1
-                
-            console.print(config_table)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+            console.print(_render_config_table(list(_iter_flat(cfg))))
+            _pause_return()
             continue
-        
-        cfg, cfg_path = load_global_config(cfg_path)
 
         # === Stage argument setup ===
-        class Args:
-            pass
-
-        args = Args()
-        mapping = {
-            "1": "segmentation",
-            "2": "segmentation-hpc",
-            "3": "merge-pools",
-            "4": "merge-pools-hpc",
-            "5": "merge-apply",
-            "6": "merge-apply-hpc",
-            "7": "status",
-            "8": "clean",
-        }
-        args.stage = mapping.get(choice)
-        args.debug = False
-
-        if args.stage in ["segmentation", "segmentation-hpc", "merge-pools"]:
+        args = argparse.Namespace(stage=_STAGE_MAPPING.get(choice), debug=False)
+
+        if args.stage in _RESTART_STAGES:
             restart_choice = Prompt.ask("[white]> Restart? (y/n)[/white]", default="n").lower()
             args.restart = restart_choice.startswith("y")
         else:
@@ -531,49 +499,82 @@ def run_interactive():
 # ==========================================================
 # main()
 # ==========================================================
-def main():
-    t1 = time.time()
+# Valid --stage / --tools values, in the order --help lists them
+_CLI_STAGES = (
+    "segmentation",
+    "segmentation-hpc",
+    "merge-pools",
+    "merge-apply",
+    "tools",
+    "status",
+    "clean",
+)
+
+_CLI_TOOLS = (
+    "convert-prec",
+    "convert-prec-hpc",
+    "downsample-prec",
+    "downsample-prec-hpc",
+    "generate-mask",
+    "generate-mask-hpc",
+    "mask-prec",
+    "mask-prec-hpc",
+    "mask-tif",
+    "mask-tif-hpc",
+    "resize-tif",
+    "resize-tif-hpc",
+)
+
+
+def _choice_type(choices):
+    """argparse ``type=`` that validates against a frozenset instead of scanning ``choices=``."""
+    allowed = frozenset(choices)
+
+    def check(value):
+        if value not in allowed:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {', '.join(choices)})"
+            )
+        return value
+
+    return check
+
+
+def _build_parser():
     parser = argparse.ArgumentParser(description="Block-wise segmentation pipeline")
     parser.add_argument(
         "--stage",
-        choices=[
-            "segmentation",
-            "segmentation-hpc",
-            "merge-pools",
-            "merge-apply",
-            "tools",
-            "status",
-            "clean",
-        ],
+        type=_choice_type(_CLI_STAGES),
+        metavar="{" + ",".join(_CLI_STAGES) + "}",
         required=True,
     )
     parser.add_argument(
         "--tools",
-        choices=[
-            "convert-prec",
-            "convert-prec-hpc",
-            "downsample-prec",
-            "downsample-prec-hpc",
-            "generate-mask",
-            "generate-mask-hpc",
-            "mask-prec",
-            "mask-prec-hpc",
-            "mask-tif",
-            "mask-tif-hpc",
-            "resize-tif",
-            "resize-tif-hpc",
-        ],
+        type=_choice_type(_CLI_TOOLS),
+        metavar="{" + ",".join(_CLI_TOOLS) + "}",
         required=False,
     )
     parser.add_argument("--restart", action="store_true")
+    parser.add_argument("--no-config-cache", action="store_true", help="Always re-parse magneton/config.yaml")
     parser.add_argument("--force-overlap", action="store_true")
     parser.add_argument("--debug", action="store_true")
-    args = parser.parse_args()
+    return parser
 
-    global_cfgs = load_global_config_path("magneton/config.yaml")
+
+def main():
+    cfg_path = "magneton/config.yaml"
+    args = _build_parser().parse_args()
+
+    t1 = time.perf_counter()
+    # On --restart (e.g. a requeued HPC job on a node with an empty /tmp), reuse the config saved in ~/.cache
+    global_cfgs = load_session(cfg_path) if args.restart and not args.no_config_cache else None
+    if global_cfgs is None:
+        global_cfgs = load_global_config_path(cfg_path, use_cache=not args.no_config_cache)
+    if args.stage in STAGE_TABLE:  # only work stages can be requeued with --restart
+        save_session(global_cfgs, cfg_path)
     run(args, global_cfgs)
-    t2 = time.time()
-    print(f"Total runtime: {t2 - t1:.2f}s")
+    if args.debug:
+        print(f"Total runtime: {time.perf_counter() - t1:.2f}s")
 
 
 if __name__ == "__main__":
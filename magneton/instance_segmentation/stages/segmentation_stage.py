@@ -1,5 +1,6 @@
 import os
 import gc
+import multiprocessing as mp
 import numpy as np
 from tqdm import tqdm
 from cloudvolume import CloudVolume
@@ -210,6 +211,12 @@ def segmentation_blocks_parallel(global_cfg, stage_cfg, restart=False):
     # thresholds = stage_cfg.get("thresholds", [0.4])
     mip = stage_cfg.get("mip", 0)
     workers = int(stage_cfg.get("workers", os.cpu_count() or 1))
+    # "process": platform default start method (fork on Linux);
+    # "spawn": fresh worker interpreters, safe once the parent has started CUDA or threaded native libs
+    parallel_mode = stage_cfg.get("parallel_mode", "process")
+    if parallel_mode not in ("process", "spawn"):
+        raise ValueError(f"Unknown parallel_mode: {parallel_mode!r} (expected 'process' or 'spawn')")
+    mp_context = mp.get_context("spawn") if parallel_mode == "spawn" else None
 
     # Open input volume (main process used only for retrieving shape/meta information)
     aff_vol = CloudVolume(input_path, mip=mip, bounded=False, progress=False)
@@ -240,11 +247,11 @@ def segmentation_blocks_parallel(global_cfg, stage_cfg, restart=False):
         print("[INFO] No pending blocks. Local stage up-to-date.")
         return
 
-    print(f"[INFO] Dispatching {len(tasks)} blocks with {workers} workers...")
+    print(f"[INFO] Dispatching {len(tasks)} blocks with {workers} workers ({parallel_mode})...")
 
     # Parallel processing
     futures = []
-    with ProcessPoolExecutor(max_workers=workers) as ex:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
         for i, coords in tasks:
             futures.append(
                 ex.submit(
@@ -6,6 +6,7 @@ from .checkpoint import (
     load_merge_state, save_merge_state,
     local_done_path, mark_local_done, is_local_done,
 )
+from .session import session_path, save_session, load_session
 
 __all__ = [
     "load_merge_state",
@@ -13,4 +14,7 @@ __all__ = [
     "local_done_path",
     "mark_local_done",
     "is_local_done",
+    "session_path",
+    "save_session",
+    "load_session",
 ]
@@ -0,0 +1,35 @@
+import os
+import hashlib
+
+from magneton.yaml_cache import read_stamped_pickle, write_stamped_pickle
+
+# ---------- CLI session ----------
+def session_path(cfg_path: str) -> str:
+    """Return the session file for a global config (one per config path; overwritten when it changes)"""
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha1(os.path.abspath(cfg_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, "magneton", f"session-{digest}.pkl")
+
+def _config_source(cfg_path: str):
+    st = os.stat(cfg_path)
+    return [os.path.abspath(cfg_path), st.st_mtime_ns, st.st_size]
+
+def save_session(global_cfg: dict, cfg_path: str):
+    """Keep the parsed global config in the home cache, which outlives the node-local /tmp of a requeued job"""
+    try:
+        source = _config_source(cfg_path)
+        path = session_path(cfg_path)
+        if read_stamped_pickle(path, source) is not None:
+            return  # already current
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    except OSError:
+        return
+    write_stamped_pickle(path, source, global_cfg)
+
+def load_session(cfg_path: str):
+    """Return the saved global config; None if missing or the config changed since"""
+    try:
+        source = _config_source(cfg_path)
+    except OSError:
+        return None
+    return read_stamped_pickle(session_path(cfg_path), source)
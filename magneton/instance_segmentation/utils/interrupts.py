@@ -3,6 +3,9 @@ import signal, threading, weakref, multiprocessing as mp
 import concurrent.futures as cf
 import time
 
+# Holds the controller whose handlers are installed on this thread; nested controllers defer to it
+_ACTIVE = threading.local()
+
 class InterruptException(Exception):
     """Raised when user interrupts execution (Ctrl+C)."""
 
@@ -16,6 +19,7 @@ class InterruptController:
         self._registry_pools = weakref.WeakSet()
         self._orig_handlers = {}
         self._patched = False
+        self._installed = False
 
     def _patch(self):
         if self._patched:
@@ -68,6 +72,11 @@ class InterruptController:
         raise InterruptException("User interrupted execution")
 
     def __enter__(self):
+        if getattr(_ACTIVE, "controller", None) is not None:
+            # An outer controller already owns SIGINT/SIGTERM; don't swap handlers again
+            return self
+        self._installed = True
+        _ACTIVE.controller = self
         self._patch()
         for s in (signal.SIGINT, signal.SIGTERM):
             self._orig_handlers[s] = signal.getsignal(s)
@@ -75,9 +84,12 @@ class InterruptController:
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        for s, h in self._orig_handlers.items():
-            signal.signal(s, h)
-        self._orig_handlers.clear()
+        if self._installed:
+            for s, h in self._orig_handlers.items():
+                signal.signal(s, h)
+            self._orig_handlers.clear()
+            self._installed = False
+            _ACTIVE.controller = None
         if exc_type is InterruptException:
             print("[Info] Task interrupted gracefully, returning to main menu.")
             return True 
@@ -10,7 +10,6 @@ import os
 import warnings
 import argparse
 import platform
-import yaml
 from datetime import datetime
 
 warnings.filterwarnings("ignore")
@@ -35,15 +34,16 @@ except ImportError:
 console = Console()
 
 # ==== Modules ====
-import magneton.instance_segmentation as ins_segmentation
-import magneton.pytorch_connectomics as aff_inference
-import magneton.toolkit as toolkit
+# Each module is imported when its menu entry is picked, so startup does not
+# pay for the backends of the modules that are never opened.
 
 # ---------------------------------------------------
 # Config loader
 # ---------------------------------------------------
 def load_global_config(path="config.yaml"):
     """Load global YAML configuration file."""
+    import yaml
+
     try:
         with open(path, "r") as f:
             return yaml.safe_load(f)
@@ -134,14 +134,17 @@ def main():
 
             if choice == "1":
                 console.rule("[bold bright_white]Pre- and Post-Processing Toolkit[/bold bright_white]", style="bold white", characters="=")
+                import magneton.toolkit as toolkit
                 toolkit.run_interactive()
 
             elif choice == "2":
                 console.rule("[bold bright_white]Affinity Map Inference Module[/bold bright_white]", style="bold white", characters="=")
+                import magneton.pytorch_connectomics as aff_inference
                 aff_inference.run_interactive()
 
             elif choice == "3":
                 console.rule("[bold bright_white]Instance Segmentation Module[/bold bright_white]", style="bold white", characters="=")
+                import magneton.instance_segmentation as ins_segmentation
                 ins_segmentation.run_interactive()
 
             elif choice == "0":
@@ -10,10 +10,13 @@ Provides:
 """
 
 import argparse
+import importlib
 import logging
 import shutil
 import os
+import re
 import time
+import types
 import yaml
 import signal
 import threading
@@ -23,16 +26,18 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.markup import escape
 from rich import box
-import torch
+
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # libyaml not available, fall back to the pure-Python parser
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 console = Console()
 
-from magneton.instance_segmentation.config import (
-    load_config,
-    get_stage_config,
-    load_global_config_path,
-)
+from magneton.toolkit.utils.config import load_config, load_global_config_path
+from magneton.compile_config import compile_config
 
 # === Pipeline modules ===
 # from magneton.instance_segmentation.stages.segmentation_stage import (
@@ -45,48 +50,114 @@ from magneton.instance_segmentation.config import (
 # from magneton.instance_segmentation.state.checkpoint import load_merge_state
 
 # === Tools ===
-from magneton.toolkit.tools.split import split_volume
-from magneton.toolkit.tools.split_hpc import split_volume_hpc
-from magneton.toolkit.tools.merge import merge_volume
-from magneton.toolkit.tools.merge_hpc import merge_volume_hpc
-from magneton.toolkit.tools.convert_prec import convert_prec
-from magneton.toolkit.tools.convert_prec_hpc import convert_prec_hpc
-from magneton.toolkit.tools.downsample_prec import downsample_prec
-from magneton.toolkit.tools.downsample_prec_hpc import downsample_prec_hpc
-from magneton.toolkit.tools.gen_mask import gen_aff_mask
-from magneton.toolkit.tools.gen_mask_hpc import gen_aff_mask_hpc
-from magneton.toolkit.tools.mask_prec import mask_prec
-from magneton.toolkit.tools.mask_prec_hpc import mask_prec_hpc
-from magneton.toolkit.tools.mask_tif import mask_tif
-from magneton.toolkit.tools.mask_tif_hpc import mask_tif_hpc
-from magneton.toolkit.tools.resize_tif import resize_tif
-from magneton.toolkit.tools.resize_tif_hpc import resize_tif_hpc
+# Normalized tool name (see _normalize_tool_name) -> (module, function). Tool modules pull in
+# heavy backends (cloudvolume, igneous, tifffile, ...), so they are imported on first use.
+_TOOL_FUNCS = {
+    "split volume": ("magneton.toolkit.tools.split", "split_volume"),
+    "split volume [hpc]": ("magneton.toolkit.tools.split_hpc", "split_volume_hpc"),
+    "merge blocks": ("magneton.toolkit.tools.merge", "merge_volume"),
+    "merge blocks [hpc]": ("magneton.toolkit.tools.merge_hpc", "merge_volume_hpc"),
+    "convert prec": ("magneton.toolkit.tools.convert_prec", "convert_prec"),
+    "convert prec [hpc]": ("magneton.toolkit.tools.convert_prec_hpc", "convert_prec_hpc"),
+    "downsample prec": ("magneton.toolkit.tools.downsample_prec", "downsample_prec"),
+    "downsample prec [hpc]": ("magneton.toolkit.tools.downsample_prec_hpc", "downsample_prec_hpc"),
+    "generate mask": ("magneton.toolkit.tools.gen_mask", "gen_aff_mask"),
+    "generate mask [hpc]": ("magneton.toolkit.tools.gen_mask_hpc", "gen_aff_mask_hpc"),
+    "mask prec": ("magneton.toolkit.tools.mask_prec", "mask_prec"),
+    "mask prec [hpc]": ("magneton.toolkit.tools.mask_prec_hpc", "mask_prec_hpc"),
+    "mask tif": ("magneton.toolkit.tools.mask_tif", "mask_tif"),
+    "mask tif [hpc]": ("magneton.toolkit.tools.mask_tif_hpc", "mask_tif_hpc"),
+    "resize tif": ("magneton.toolkit.tools.resize_tif", "resize_tif"),
+    "resize tif [hpc]": ("magneton.toolkit.tools.resize_tif_hpc", "resize_tif_hpc"),
+}
+_TOOL_FUNC_CACHE = {}
+
+
+def _load_tool(name):
+    """Import (once) and return the function implementing tool ``name``."""
+    fn = _TOOL_FUNC_CACHE.get(name)
+    if fn is None:
+        module_name, func_name = _TOOL_FUNCS[name]
+        fn = getattr(importlib.import_module(module_name), func_name)
+        _TOOL_FUNC_CACHE[name] = fn
+    return fn
 
 from magneton.toolkit.utils.interrupts import InterruptController
 
+# === Tool config paths ===
+# Used for any key missing from the ``toolkit`` section of the global config
+_DEFAULT_CFG_PATHS = {
+    "split": "magneton/toolkit/configs/config_split.yaml",
+    "merge": "magneton/toolkit/configs/config_merge.yaml",
+    "prec": "magneton/toolkit/configs/config_prec.yaml",
+    "downsample": "magneton/toolkit/configs/config_downsample.yaml",
+    "gen_mask": "magneton/toolkit/configs/config_gen_mask.yaml",
+    "mask_prec": "magneton/toolkit/configs/config_mask.yaml",
+    "mask_tif": "magneton/toolkit/configs/config_mask_tif.yaml",
+    "resize_tif": "magneton/toolkit/configs/config_resize_tif.yaml",
+}
+
+# Tools built on utils.pipeline; they accept a workers= override from --workers
+_PIPELINED_TOOLS = frozenset({"split volume", "mask prec"})
+
+# Normalized tool name -> _DEFAULT_CFG_PATHS key holding its config path
+_TOOL_TO_CFG_KEY = types.MappingProxyType({
+    "split volume": "split",
+    "split volume [hpc]": "split",
+    "merge blocks": "merge",
+    "merge blocks [hpc]": "merge",
+    "convert prec": "prec",
+    "convert prec [hpc]": "prec",
+    "downsample prec": "downsample",
+    "downsample prec [hpc]": "downsample",
+    "generate mask": "gen_mask",
+    "generate mask [hpc]": "gen_mask",
+    "mask prec": "mask_prec",
+    "mask prec [hpc]": "mask_prec",
+    "mask tif": "mask_tif",
+    "mask tif [hpc]": "mask_tif",
+    "resize tif": "resize_tif",
+    "resize tif [hpc]": "resize_tif",
+})
+
+
+def _normalize_tool_name(name):
+    """Map a menu label ("Convert Prec [HPC]") or CLI choice ("convert-prec-hpc") to the tool key."""
+    key = name.strip().lower()
+    if key.endswith("-hpc"):
+        key = key[:-len("-hpc")] + " [hpc]"
+    return key.replace("-", " ")
+
+
 # ==========================================================
 # Unified CLI interface (for package-level use)
 # ==========================================================
-def edit_stage_config(config_path: str, stage_name: str):
-    """Ask user whether to modify stage-specific YAML config before running."""
-    print(f"\nStage: {stage_name}")
-    print(f"Config path: {config_path}")
+# Plain int/float literals typed at the "New value" prompt (e.g. 8, -0.5, 1e-5)
+_NUM_RE = re.compile(r"^[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?$")
 
-    if not os.path.exists(config_path):
-        print(f"Config file not found at {config_path}, skipping modification.")
-        return config_path
-            
-    if not Prompt.ask("[white]> Modify this stage config before running? (y/n)[/white]", default="n").lower().startswith("y"):
-        return config_path
 
-    # Read configuration file
-    with open(config_path, "r") as f:
-        cfg_data = yaml.safe_load(f)
+def _coerce_number(value: str):
+    """Convert a numeric-looking string to int/float; anything else is returned unchanged."""
+    if not _NUM_RE.match(value):
+        return value
+    if any(c in value for c in ".eE"):
+        return float(value)
+    return int(value)
 
-    # Display Configuration Items (Single Layer)
-    flat_keys = []
-    flat_sections = []
-    print("\nAvailable parameters in config:")
+
+def _iter_flat(cfg):
+    """Yield (section, key, container) for every editable leaf; container[key] is the value."""
+    for section, sub in cfg.items():
+        if isinstance(sub, dict):
+            for k in sub:
+                yield section, k, sub
+        else:
+            yield section, section, cfg
+
+
+def _render_config_table(entries):
+    """Build the Index/Section/Parameter/Value table for (section, key, container) entries."""
+    rows = [(str(i), str(sec), str(k), f"[cyan]{c[k]}[/cyan]") for i, (sec, k, c) in enumerate(entries, 1)]
     config_table = Table(
             box=box.SIMPLE,
             title_style="bold bright_white",
@@ -97,88 +168,86 @@ def edit_stage_config(config_path: str, stage_name: str):
     config_table.add_column("Section", style="white")
     config_table.add_column("Parameter", style="white")
     config_table.add_column("Value", style="white")
+    for row in rows:
+        config_table.add_row(*row)
+    return config_table
+
+
+def confirm_stage(stage_name):
+    """Ask before starting a stage; returns False if the user types 'q'."""
+    resp = Prompt.ask(
+        f"\nStarting stage: {escape(stage_name)}\nPress Enter to continue or type 'q' to cancel",
+        choices=["", "q"],
+        default="",
+        case_sensitive=False,
+        show_choices=False,
+        show_default=False,
+    )
+    if resp == "q":
+        console.print(f"[bold red]▶ Canceled stage: {escape(stage_name)}.[/bold red]\n")
+        return False
+    return True
 
-    i = 1
 
-    for section, sub in cfg_data.items():
-        # console.print(f"[bold]{section}[/bold]:")
-        
-        if isinstance(sub, dict):
-            for k, v in sub.items():
-                # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                flat_keys.append(k)
-                flat_sections.append(section)
-                config_table.add_row(f"{i}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                i += 1
-        else:
-            # console.print(f"   - [cyan]{sub}[/cyan]")
-            flat_keys.append(section)
-            flat_sections.append(section)
-            config_table.add_row(f"{i}", f"{section}", f"{section}",  f"[cyan]{sub}[/cyan]")
-            i += 1
-        
-    console.print(config_table)
+def _pause_return():
+    """Block until the user presses Enter to go back to the menu."""
+    Prompt.ask("Press Enter to return menu", default="", show_default=False)
+
+
+def edit_stage_config(config_path: str, stage_name: str):
+    """Ask user whether to modify stage-specific YAML config before running."""
+    console.print(f"\nStage: {escape(stage_name)}\nConfig path: {escape(config_path)}")
+
+    if not os.path.exists(config_path):
+        console.print(f"Config file not found at {escape(config_path)}, skipping modification.")
+        return config_path
+            
+    if not Prompt.ask("[white]> Modify this stage config before running? (y/n)[/white]", default="n").lower().startswith("y"):
+        return config_path
+
+    # Read configuration file
+    with open(config_path, "r") as f:
+        cfg_data = yaml.load(f, Loader=_SafeLoader)
 
-    # idx = 1
-    # for k, v in cfg_data.items():
-    #     print(f"{idx}. {k}: {v}")
-    #     flat_keys.append(k)
-    #     idx += 1
+    # Display Configuration Items (Single Layer)
+    console.print("\nAvailable parameters in config:")
+    entries = list(_iter_flat(cfg_data))
+    console.print(_render_config_table(entries))
 
+    dirty = False
     while True:
         choice = input("> Select parameter to modify (number, or ENTER to finish): ").strip()
         if choice == "":
             break
-        if not choice.isdigit() or not (1 <= int(choice) <= len(flat_keys)):
-            print("Invalid selection.")
+        idx = int(choice) if choice.isdigit() else 0
+        if not (1 <= idx <= len(entries)):
+            console.print("[red]Invalid selection.[/red]")
             continue
 
-        key = flat_keys[int(choice) - 1]
-        section_key = flat_sections[int(choice) - 1]
-        if key == section_key:
-            old_val = cfg_data[section_key]
-            print(f"Current value for {section_key}/{key}: {old_val}")
-            new_val = input("New value: ").strip()
-            if new_val == "":
-                print("No change made.")
-                continue
-
-            # Automatic Type Conversion (int/float)
-            try:
-                if "." in new_val:
-                    new_val = float(new_val)
-                else:
-                    new_val = int(new_val)
-            except ValueError:
-                pass
-
-            cfg_data[section_key] = new_val
-        else:
-            old_val = cfg_data[section_key][key]
-            print(f"Current value for {section_key}/{key}: {old_val}")
-            new_val = input("New value: ").strip()
-            if new_val == "":
-                print("No change made.")
-                continue
-
-            # Automatic Type Conversion (int/float)
-            try:
-                if "." in new_val:
-                    new_val = float(new_val)
-                else:
-                    new_val = int(new_val)
-            except ValueError:
-                pass
-
-            cfg_data[section_key][key] = new_val
-        print(f"Updated {key} → {new_val}")
+        section_key, key, container = entries[idx - 1]
+        # Current value and the prompt go out as one write
+        new_val = input(f"Current value for {section_key}/{key}: {container[key]}\nNew value: ").strip()
+        if new_val == "":
+            console.print("No change made.")
+            continue
+
+        # Automatic Type Conversion (int/float)
+        new_val = _coerce_number(new_val)
+
+        container[key] = new_val
+        dirty = True
+        console.print(f"Updated {escape(str(key))} → {escape(str(new_val))}")
+
+    # Nothing edited: run with the original file instead of re-serializing it
+    if not dirty:
+        return config_path
 
     # Save to temporary file
     # temp_path = config_path + ".tmp"
     temp_path = config_path
     with open(temp_path, "w") as f:
-        yaml.safe_dump(cfg_data, f, sort_keys=False)
-    print(f"Temporary modified config saved: {temp_path}")
+        yaml.dump(cfg_data, f, Dumper=_SafeDumper, sort_keys=False)
+    console.print(f"Temporary modified config saved: {escape(temp_path)}")
 
     return temp_path
 
@@ -197,48 +266,7 @@ def run(args, global_cfg):
     )
 
     # Resolve config paths
-    split_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("split", "magneton/toolkit/configs/config_split.yaml")
-    )
-    merge_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("merge", "magneton/toolkit/configs/config_merge.yaml")
-    )
-    prec_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("prec", "magneton/toolkit/configs/config_prec.yaml")
-    )
-    downsample_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("downsample", "magneton/toolkit/configs/config_downsample.yaml")
-    )
-    gen_mask_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("gen_mask", "magneton/toolkit/configs/config_gen_mask.yaml")
-    )
-    mask_prec_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("mask_prec", "magneton/toolkit/configs/config_mask.yaml")
-    )
-    mask_tif_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("mask_tif", "magneton/toolkit/configs/config_mask_tif.yaml")
-    )
-    resize_tif_cfg_path = (
-        global_cfg.get("toolkit", {})
-        .get("resize_tif", "magneton/toolkit/configs/config_resize_tif.yaml")
-    )
-
-    def confirm_stage(stage_name):
-        print(f"\nStarting stage: {stage_name}")
-        print("Press Enter to continue or type 'q' to cancel.")
-        resp = input("> ").strip().lower()
-        if resp == "q":
-            # print(f"Canceled stage: {stage_name}")
-            console.print(f"[bold red]▶ Canceled stage: {stage_name}.[/bold red]\n")
-            return False
-        return True
+    paths = {**_DEFAULT_CFG_PATHS, **(global_cfg.get("toolkit") or {})}
 
     # -----------------------------------
     # Stage logic
@@ -246,25 +274,7 @@ def run(args, global_cfg):
     try:
         if not confirm_stage(f"Tool: {args.tools}"):
             return
-        tool_map = {
-            "split volume": split_cfg_path,
-            "split volume [hpc]": split_cfg_path, 
-            "merge blocks": merge_cfg_path, 
-            "merge blocks [hpc]": merge_cfg_path,
-            "convert prec": prec_cfg_path,
-            "convert prec [hpc]": prec_cfg_path,
-            "downsample prec": downsample_cfg_path,
-            "downsample prec [hpc]": downsample_cfg_path,
-            "generate mask": gen_mask_cfg_path,
-            "generate mask [hpc]": gen_mask_cfg_path,
-            "mask prec": mask_prec_cfg_path,
-            "mask prec [hpc]": mask_prec_cfg_path,
-            "mask tif": mask_tif_cfg_path,
-            "mask tif [hpc]": mask_tif_cfg_path,
-            "resize tif": resize_tif_cfg_path,
-            "resize tif [hpc]": resize_tif_cfg_path,
-        }
-        tool_cfg_path = tool_map.get(args.tools.lower(), prec_cfg_path)
+        tool_cfg_path = paths[_TOOL_TO_CFG_KEY.get(_normalize_tool_name(args.tools), "prec")]
         # print(args.tools)
         tool_cfg_path = edit_stage_config(tool_cfg_path, f"Tool: {args.tools}")
         print(f"Running tool with config: {tool_cfg_path}")
@@ -272,8 +282,7 @@ def run(args, global_cfg):
         with InterruptController():
             handle_tools(args, tool_cfg)
             # handle_tools(args, global_cfg)
-        print("Press Enter to return menu.")
-        input("> ").strip().lower()
+        _pause_return()
         # safe_run(handle_tools, args, global_cfg)
 
         console.print(f"[bold green]▶ Stage {args.stage} completed.[/bold green]\n")
@@ -289,31 +298,17 @@ def run(args, global_cfg):
 def handle_tools(args, tool_cfg):
     """Dispatch preprocessing tools."""
 
-    tools_map = {
-        "split blocks": lambda: split_volume(tool_cfg),
-        "split blocks [hpc]": lambda: split_volume_hpc(tool_cfg),
-        "merge blocks": lambda: merge_volume(tool_cfg),
-        "merge blocks [hpc]": lambda: merge_volume_hpc(tool_cfg),
-        "convert prec": lambda: convert_prec(tool_cfg),
-        "convert prec [hpc]": lambda: convert_prec_hpc(tool_cfg),
-        "downsample prec": lambda: downsample_prec(tool_cfg),
-        "downsample prec [hpc]": lambda: downsample_prec_hpc(tool_cfg),
-        "generate mask": lambda: gen_aff_mask(tool_cfg),
-        "generate mask [hpc]": lambda: gen_aff_mask_hpc(tool_cfg),
-        "mask prec": lambda: mask_prec(tool_cfg),
-        "mask prec [hpc]": lambda: mask_prec_hpc(tool_cfg),
-        "mask tif": lambda: mask_tif(tool_cfg),
-        "mask tif [hpc]": lambda: mask_tif_hpc(tool_cfg),
-        "resize tif": lambda: resize_tif(tool_cfg),
-        "resize tif [hpc]": lambda: resize_tif_hpc(tool_cfg),
-    }
-
-    tool_fn = tools_map.get(args.tools.lower())
-    if tool_fn is None:
+    name = _normalize_tool_name(args.tools)
+    if name not in _TOOL_FUNCS:
         print(f"Unknown tool: {args.tools}")
+        return
+
+    # run() already wraps this call in an InterruptController
+    workers = getattr(args, "workers", None)
+    if workers and name in _PIPELINED_TOOLS:
+        _load_tool(name)(tool_cfg, workers=workers)
     else:
-        with InterruptController():
-            tool_fn()
+        _load_tool(name)(tool_cfg)
 
 
 # ==========================================================
@@ -322,8 +317,8 @@ def handle_tools(args, tool_cfg):
 def load_global_config(path="magneton/config.yaml"):
     """Load YAML config file."""
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        # Same loader (and caches) as the CLI path in main()
+        cfg = load_global_config_path(path)
         print(f"\nLoaded global config from: {path}")
         return cfg, path
     except FileNotFoundError:
@@ -334,7 +329,10 @@ def load_global_config(path="magneton/config.yaml"):
 def save_global_config(cfg, path):
     """Save updated YAML config."""
     with open(path, "w") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False)
+        yaml.dump(cfg, f, Dumper=_SafeDumper, sort_keys=False)
+    if os.path.exists(path + ".pkl"):
+        # Keep the compiled copy in step, or every later run would warn that it is stale
+        compile_config(path)
     print(f"Saved updated global config to: {path}")
 
 
@@ -346,69 +344,29 @@ def modify_global_config(cfg, cfg_path):
     # if new_path:
     #     cfg, cfg_path = load_global_config(new_path)
 
-    flat_items = []
-    # print("\nAvailable config parameters:")
-    idx = 1
-    # for section, sub in cfg.items():
-    #     if isinstance(sub, dict):
-    #         for k, v in sub.items():
-    #             flat_items.append((f"{section}/{k}", v))
-    #             print(f"{idx}. {section}/{k}: {v}")
-    #             idx += 1
-    #     else:
-    #         flat_items.append((section, sub))
-    #         print(f"{idx}. {section}: {sub}")
-    #         idx += 1
     console.rule("[bold bright_white]Available Config Parameters[/bold bright_white]", style="bright_cyan")
-    config_table = Table(
-            box=box.SIMPLE,
-            title_style="bold bright_white",
-            header_style="bright_white",
-            show_header=True
-        )
-    config_table.add_column("Index", justify="center", style="white")
-    config_table.add_column("Section", style="white")
-    config_table.add_column("Parameter", style="white")
-    config_table.add_column("Value", style="white")
-
-    for section, sub in cfg.items():
-        # console.print(f"[bold]{section}[/bold]:")
-        if isinstance(sub, dict):
-            for k, v in sub.items():
-                # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                flat_items.append((f"{section}/{k}", v))
-                config_table.add_row(f"{idx}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                idx += 1
-        else:
-            # console.print(f"   - [cyan]{sub}[/cyan]")
-            flat_items.append((section, sub))
-            config_table.add_row("-", "-", "-", f"[cyan]{sub}[/cyan]")
-            idx += 1
-        
-    console.print(config_table)
+    entries = list(_iter_flat(cfg))
+    console.print(_render_config_table(entries))
     while True:
         choice = input("> Select parameter to modify (number, or ENTER to finish): ").strip()
         if choice == "":
             break
-        if not choice.isdigit() or not (1 <= int(choice) <= len(flat_items)):
-            print("Invalid selection.")
+        idx = int(choice) if choice.isdigit() else 0
+        if not (1 <= idx <= len(entries)):
+            console.print("[red]Invalid selection.[/red]")
             continue
 
-        key_path, old_val = flat_items[int(choice) - 1]
-        # print('\n')
-        print(f"Current value for {key_path}: {old_val}")
-        new_val = input("> New value: ").strip()
+        section, key, container = entries[idx - 1]
+        key_path = section if container is cfg else f"{section}/{key}"
+        # Current value and the prompt go out as one write
+        new_val = input(f"Current value for {key_path}: {container[key]}\n> New value: ").strip()
         if new_val == "":
-            print("No change made.")
+            console.print("No change made.")
             continue
 
         # Apply modification
-        parts = key_path.split("/")
-        target = cfg
-        for p in parts[:-1]:
-            target = target[p]
-        target[parts[-1]] = new_val
-        print(f"Updated {key_path} → {new_val}")
+        container[key] = new_val
+        console.print(f"Updated {escape(str(key_path))} → {escape(new_val)}")
 
     if Prompt.ask("[white]> Save changes to file? (y/n)[/white]", default="n").lower().startswith("y"):
         save_global_config(cfg, cfg_path)
@@ -418,60 +376,75 @@ def modify_global_config(cfg, cfg_path):
     return cfg, cfg_path
 
 
+def _build_tools_menu(tool_list, tool_help):
+    """Build the tools menu table from the tool names and their help strings."""
+    tool_table = Table(show_header=True, box=box.SIMPLE, border_style="white", 
+            title_style="bold bright_white",header_style="bright_white",)
+    tool_table.add_column("Option", justify="center", style="white")
+    tool_table.add_column("Tool", style="white")
+    tool_table.add_column("Description", style="white")
+    for i, name in enumerate(tool_list, start=1):
+        desc = tool_help.get(name.lower(), "No description available.")
+        tool_table.add_row(f"{i}", f"{name}", f"{desc}")
+
+    tool_table.add_row("0", f"Return", "Return to main menu")
+    return tool_table
+
+
+# === Tool List ===
+_TOOL_LIST = (
+    "Split Volume",
+    "Split Volume [HPC]",
+    "Merge Blocks",
+    "Merge Blocks [HPC]",
+    "Convert Prec",
+    "Convert Prec [HPC]",
+    "Downsample Prec",
+    "Downsample Prec [HPC]",
+    "Generate Mask",
+    "Generate Mask [HPC]",
+    "Mask Prec",
+    "Mask Prec [HPC]",
+    "Mask Tif",
+    "Mask Tif [HPC]",
+    "Resize Tif",
+    "Resize Tif [HPC]",
+    "Modify Global Config",
+    "View Current Config",
+)
+
+# === Help descriptions ===
+_TOOL_HELP = types.MappingProxyType({
+    "split volume": "Split tif volume to tif blocks with overlap.",
+    "split volume [hpc]": "Split tif volume to tif blocks with overlap in HPC.",
+    "merge blocks": "Merge h5 blocks (inference results) to tif volume with overlap",
+    "merge blocks [hpc]": "Merge h5 blocks (inference results) to tif volume with overlap in HPC",
+    "convert prec": "Convert tif/h5 data to precomputed format.",
+    "convert prec [hpc]": "Convert tif/h5 data to precomputed format by using hpc resources.",
+    "downsample prec": "Create lower-resolution mipmap levels using voxel downsampling for precomputed data.",
+    "downsample prec [hpc]": "Create lower-resolution mipmap levels using voxel downsampling for precomputed data by using hpc resources.",
+    "generate mask": "Generate binary masks from affinity maps.",
+    "generate mask [hpc]": "Generate binary masks from affinity maps by using hpc resources.",
+    "mask prec": "Apply a mask to prec images, preserving structure.",
+    "mask prec [hpc]": "Apply a mask to prec images by using hpc resources.",
+    "mask tif": "Apply a mask to tif images, preserving structure.",
+    "mask tif [hpc]": "Apply a mask to tif images by using hpc resources.",
+    "resize tif": "Resize tif volumes to new voxel size or dimension.",
+    "resize tif [hpc]": "Resize tif volumes to new voxel size or dimension by using hpc resources.",
+    "modify global config": "Modify the global configuration files for each module",
+    "view current config":"View the global configuration files for each module",
+})
+
+# The tools menu never changes, so build it once at import
+_TOOLS_MENU_TABLE = _build_tools_menu(_TOOL_LIST, _TOOL_HELP)
+
+
 def run_interactive():
     """Interactive CLI mode with styled Rich interface."""
     console.print("\n[bold bright_white] Pre- and Post-Processing Mode [/bold bright_white]\n")
 
     cfg_path = "magneton/config.yaml"
-    # cfg, cfg_path = load_global_config(cfg_path)
-
-    # choice_pool = [str(i) for i in range(10)] + ["h", "help"]
-    # choice_pool = [str(i) for i in range(16)]
-
-    # === Help descriptions ===
-
-    # === Tool List ===
-    tool_list = [
-        "Split Volume",
-        "Split Volume [HPC]",
-        "Merge Blocks",
-        "Merge Blocks [HPC]",
-        "Convert Prec",
-        "Convert Prec [HPC]",
-        "Downsample Prec",
-        "Downsample Prec [HPC]",
-        "Generate Mask",
-        "Generate Mask [HPC]",
-        "Mask Prec",
-        "Mask Prec [HPC]",
-        "Mask Tif",
-        "Mask Tif [HPC]",
-        "Resize Tif",
-        "Resize Tif [HPC]",
-        "Modify Global Config",
-        "View Current Config",
-    ]
-
-    tool_help = {
-        "split volume": "Split tif volume to tif blocks with overlap.",
-        "split volume [hpc]": "Split tif volume to tif blocks with overlap in HPC.",
-        "merge blocks": "Merge h5 blocks (inference results) to tif volume with overlap",
-        "merge blocks [hpc]": "Merge h5 blocks (inference results) to tif volume with overlap in HPC",
-        "convert prec": "Convert tif/h5 data to precomputed format.",
-        "convert prec [hpc]": "Convert tif/h5 data to precomputed format by using hpc resources.",
-        "downsample prec": "Create lower-resolution mipmap levels using voxel downsampling for precomputed data.",
-        "downsample prec [hpc]": "Create lower-resolution mipmap levels using voxel downsampling for precomputed data by using hpc resources.",
-        "generate mask": "Generate binary masks from affinity maps.",
-        "generate mask [hpc]": "Generate binary masks from affinity maps by using hpc resources.",
-        "mask prec": "Apply a mask to prec images, preserving structure.",
-        "mask prec [hpc]": "Apply a mask to prec images by using hpc resources.",
-        "mask tif": "Apply a mask to tif images, preserving structure.",
-        "mask tif [hpc]": "Apply a mask to tif images by using hpc resources.",
-        "resize tif": "Resize tif volumes to new voxel size or dimension.",
-        "resize tif [hpc]": "Resize tif volumes to new voxel size or dimension by using hpc resources.",
-        "modify global config": "Modify the global configuration files for each module",
-        "view current config":"View the global configuration files for each module",
-    }
+    cfg, cfg_path = load_global_config(cfg_path)
 
     while True:
         # console.rule("[bold bright_white]Instance Segmentation Menu[/bold bright_white]", style="bold white")
@@ -480,36 +453,12 @@ def run_interactive():
         #     console.print("[red]Invalid selection. Try again.[/red]")
         #     continue
         
-        choice = "1"
-       
-        cfg, cfg_path = load_global_config(cfg_path)
-
         # === Stage argument setup ===
-        class Args:
-            pass
-
-        args = Args()
-        mapping = {
-            "1": "tools",
-        }
-        args.stage = mapping.get(choice)
-        args.debug = False
+        args = argparse.Namespace(stage="tools", debug=False)
 
         # === Tools submenu ===
         console.rule("[bold bright_white]Tools Menu[/bold bright_white]", style="bold white")
-        tool_table = Table(show_header=True, box=box.SIMPLE, border_style="white", 
-                title_style="bold bright_white",header_style="bright_white",)
-        tool_table.add_column("Option", justify="center", style="white")
-        tool_table.add_column("Tool", style="white")
-        tool_table.add_column("Description", style="white")
-        for i, name in enumerate(tool_list, start=1):
-            desc = tool_help.get(name.lower(), "No description available.")
-            # tool_table.add_row(f"[cyan]{i}.[/] {name}")
-            tool_table.add_row(f"{i}", f"{name}", f"{desc}")
-
-        tool_table.add_row("0", f"Return", "Return to main menu")
-        # tool_table.add_row("h", f"Help", "Tools description")
-        console.print(tool_table)
+        console.print(_TOOLS_MENU_TABLE)
 
         selected = Prompt.ask("[bright_white]> Select tool [index][/bright_white]", default="0").strip().lower()
         if selected in ["0", ""]:
@@ -518,48 +467,22 @@ def run_interactive():
 
         if selected == "17":
             cfg, cfg_path = modify_global_config(cfg, cfg_path)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+            _pause_return()
             continue
 
         if selected == "18":
             console.rule("[bold bright_white]Current Global Config[/bold bright_white]", style="bright_cyan")
-            config_table = Table(
-                    box=box.SIMPLE,
-                    title_style="bold bright_white",
-                    header_style="bright_white",
-                    show_header=True
-                )
-            config_table.add_column("Index", justify="center", style="white")
-            config_table.add_column("Section", style="white")
-            config_table.add_column("Parameter", style="white")
-            config_table.add_column("Value", style="white")
-    
-            for section, sub in cfg.items():
-                # console.print(f"[bold]{section}[/bold]:")
-                i = 1
-                if isinstance(sub, dict):
-                    for k, v in sub.items():
-                        # console.print(f"   - {k}: [cyan]{v}[/cyan]")
-                        config_table.add_row(f"{i}", f"{section}", f"{k}", f"[cyan]{v}[/cyan]")
-                        i += 1
-                else:
-                    # console.print(f"   - [cyan]{sub}[/cyan]")
-                    config_table.add_row("-", "-", "-", f"[cyan]{sub}[/cyan]")
-                    i += 1
-                
-            console.print(config_table)
-            print("Press Enter to return menu.")
-            input("> ").strip().lower()
+            console.print(_render_config_table(list(_iter_flat(cfg))))
+            _pause_return()
             continue
 
         selected_indices = []
         for x in selected.replace(",", " ").split():
             if x.isdigit():
                 idx = int(x)
-                if 1 <= idx <= len(tool_list):
-                    selected_indices.append(tool_list[idx - 1])
-            elif x in tool_list:
+                if 1 <= idx <= len(_TOOL_LIST):
+                    selected_indices.append(_TOOL_LIST[idx - 1])
+            elif x in _TOOL_LIST:
                 selected_indices.append(x)
 
         if not selected_indices:
@@ -578,43 +501,67 @@ def run_interactive():
 # ==========================================================
 # main()
 # ==========================================================
+# Valid --stage / --tools values, in the order --help lists them
+_CLI_STAGES = (
+    "tools",
+)
+
+_CLI_TOOLS = (
+    "convert-prec",
+    "convert-prec-hpc",
+    "downsample-prec",
+    "downsample-prec-hpc",
+    "generate-mask",
+    "generate-mask-hpc",
+    "mask-prec",
+    "mask-prec-hpc",
+    "mask-tif",
+    "mask-tif-hpc",
+    "resize-tif",
+    "resize-tif-hpc",
+)
+
+
+def _choice_type(choices):
+    """argparse ``type=`` that validates against a frozenset instead of scanning ``choices=``."""
+    allowed = frozenset(choices)
+
+    def check(value):
+        if value not in allowed:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {', '.join(choices)})"
+            )
+        return value
+
+    return check
+
+
 def main():
-    t1 = time.time()
     parser = argparse.ArgumentParser(description="Block-wise segmentation pipeline")
     parser.add_argument(
         "--stage",
-        choices=[
-            "tools",
-        ],
+        type=_choice_type(_CLI_STAGES),
+        metavar="{" + ",".join(_CLI_STAGES) + "}",
         required=True,
     )
     parser.add_argument(
         "--tools",
-        choices=[
-            "convert-prec",
-            "convert-prec-hpc",
-            "downsample-prec",
-            "downsample-prec-hpc",
-            "generate-mask",
-            "generate-mask-hpc",
-            "mask-prec",
-            "mask-prec-hpc",
-            "mask-tif",
-            "mask-tif-hpc",
-            "resize-tif",
-            "resize-tif-hpc",
-        ],
+        type=_choice_type(_CLI_TOOLS),
+        metavar="{" + ",".join(_CLI_TOOLS) + "}",
         required=False,
     )
     parser.add_argument("--restart", action="store_true")
+    parser.add_argument("--no-config-cache", action="store_true", help="Always re-parse magneton/config.yaml")
     parser.add_argument("--force-overlap", action="store_true")
+    parser.add_argument("--workers", type=int, help="Threads per read/process/write step (overrides num_workers)")
     parser.add_argument("--debug", action="store_true")
     args = parser.parse_args()
 
-    global_cfgs = load_global_config_path("magneton/config.yaml")
+    t1 = time.perf_counter()
+    global_cfgs = load_global_config_path("magneton/config.yaml", use_cache=not args.no_config_cache)
     run(args, global_cfgs)
-    t2 = time.time()
-    print(f"Total runtime: {t2 - t1:.2f}s")
+    if args.debug:
+        print(f"Total runtime: {time.perf_counter() - t1:.2f}s")
 
 
 if __name__ == "__main__":
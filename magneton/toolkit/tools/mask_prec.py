@@ -3,6 +3,7 @@ from cloudvolume import CloudVolume
 from tqdm import tqdm
 import argparse
 from magneton.toolkit.utils.config import load_config
+from magneton.toolkit.utils.pipeline import run_pipeline, workers_from_cfg
 
 
 def apply_mask_to_precomputed(
@@ -12,10 +13,12 @@ def apply_mask_to_precomputed(
     mip=0, 
     fill_missing=True, 
     bounded=True, 
-    progress=True
+    progress=True,
+    num_workers=4,
 ):
-    raw_vol = CloudVolume(raw_path, mip=mip, fill_missing=fill_missing, bounded=bounded, progress=progress)
-    mask_vol = CloudVolume(mask_path, mip=mip, fill_missing=fill_missing, bounded=bounded, progress=progress)
+    # Volumes are read/written from many pipeline threads; their per-call bars would interleave with "Blocks"
+    raw_vol = CloudVolume(raw_path, mip=mip, fill_missing=fill_missing, bounded=bounded, progress=False)
+    mask_vol = CloudVolume(mask_path, mip=mip, fill_missing=fill_missing, bounded=bounded, progress=False)
 
     # Create output volume
     info = CloudVolume.create_new_info(
@@ -28,33 +31,43 @@ def apply_mask_to_precomputed(
         chunk_size=raw_vol.chunk_size,
         volume_size=raw_vol.volume_size,
     )
-    out_vol = CloudVolume(output_path, info=info, mip=mip, progress=progress, compress=False)
+    out_vol = CloudVolume(output_path, info=info, mip=mip, progress=False, compress=False)
     out_vol.commit_info()
     out_vol.commit_provenance()
 
     X, Y, Z = raw_vol.volume_size
     cx, cy, cz = raw_vol.chunk_size
 
-    # triple for loop over chunks
-    for z in tqdm(range(0, Z, cz), desc="Z-slices"):
-        try:
-            for y in range(0, Y, cy):
-                for x in range(0, X, cx):
-                    x1, y1, z1 = min(x+cx, X), min(y+cy, Y), min(z+cz, Z)
+    blocks = [
+        np.s_[x:min(x+cx, X), y:min(y+cy, Y), z:min(z+cz, Z)]
+        for z in range(0, Z, cz)
+        for y in range(0, Y, cy)
+        for x in range(0, X, cx)
+    ]
 
-                    raw_block = raw_vol[x:x1, y:y1, z:z1]
-                    mask_block = mask_vol[x:x1, y:y1, z:z1]
+    def load(bbox):
+        raw_block = raw_vol[bbox]
+        mask_block = mask_vol[bbox]
+        if raw_block is None or mask_block is None:
+            pbar.update(1)  # skipped blocks still count towards the bar
+            return None
+        return raw_block, mask_block
 
-                    if raw_block is None or mask_block is None:
-                        continue
+    def apply_mask(bbox, pair):
+        # mask_bool = mask_block.astype(bool)
+        raw_block, mask_block = pair
+        return raw_block * mask_block
 
-                    # Apply mask
-                    # mask_bool = mask_block.astype(bool)
-                    masked_block = raw_block * mask_block
+    def write(bbox, masked_block):
+        out_vol[bbox] = masked_block
+        pbar.update(1)
 
-                    out_vol[x:x1, y:y1, z:z1] = masked_block
+    # Reads, masking and writes of different blocks overlap across worker threads
+    with tqdm(total=len(blocks), desc="Blocks", disable=not progress) as pbar:
+        try:
+            run_pipeline(blocks, load, apply_mask, write, workers=num_workers)
         except KeyboardInterrupt:
-            break
+            pass
 
     print(f"Done! Masked dataset saved to: {output_path}")
 
@@ -72,10 +85,11 @@ def main():
         raw_path=raw_path,
         mask_path=mask_path,
         output_path=output_path,
-        mip=mip
+        mip=mip,
+        num_workers=workers_from_cfg(cfg, "mask"),
     )
 
-def mask_prec(cfg):
+def mask_prec(cfg, workers=None):
     raw_path = cfg["mask"]["raw_path"]
     mask_path = cfg["mask"]["mask_path"]
     output_path = cfg["mask"]["output_path"]
@@ -84,7 +98,8 @@ def mask_prec(cfg):
         raw_path=raw_path,
         mask_path=mask_path,
         output_path=output_path,
-        mip=mip
+        mip=mip,
+        num_workers=workers_from_cfg(cfg, "mask", workers),
     )
 
 if __name__=='__main__':
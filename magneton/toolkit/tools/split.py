@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 import argparse
 from fractions import Fraction
 from magneton.toolkit.utils.config import load_config, load_global_config_path
+from magneton.toolkit.utils.pipeline import run_pipeline, workers_from_cfg
 
 try:
     from cloudvolume import CloudVolume
@@ -14,7 +15,7 @@ except ImportError:
     CloudVolume = None
 
 
-def _split_volume(path, save_path='', chunk_size=[512, 512, 512], overlap=[64, 64, 64], mip=0):
+def _split_volume(path, save_path='', chunk_size=[512, 512, 512], overlap=[64, 64, 64], mip=0, num_workers=4):
     """
     Split a 3D/4D volume (TIFF or precomputed) into smaller overlapping chunks.
 
@@ -23,6 +24,7 @@ def _split_volume(path, save_path='', chunk_size=[512, 512, 512], overlap=[64, 6
         save_path (str): Directory to save output TIFF chunks.
         chunk_size (list[int]): [z, y, x] chunk size.
         overlap (list[int]): [z, y, x] overlap in voxels.
+        num_workers (int): Threads each for reading and writing chunks.
     """
     if not os.path.exists(save_path):
         os.makedirs(save_path)
@@ -85,32 +87,39 @@ def _split_volume(path, save_path='', chunk_size=[512, 512, 512], overlap=[64, 6
     # -------------------------------------
     # Iterate over chunks
     # -------------------------------------
-    chunk_idx = 0
-    for zi, (zs, ze) in enumerate(z_ranges):
-        for yi, (ys, ye) in enumerate(y_ranges):
-            for xi, (xs, xe) in enumerate(x_ranges):
-                if is_precomputed:
-                    # CloudVolume expects (x,y,z)
-                    bbox = np.s_[
-                        xs:xe,
-                        ys:ye,
-                        zs:ze,
-                    ]
-                    chunk = np.asarray(vol[bbox])
-                    # (Z,Y,X) ordering
-                    # chunk = np.transpose(chunk, (2, 1, 0))
-                else:
-                    if ndim == 3:
-                        chunk = vol[zs:ze, ys:ye, xs:xe]
-                    else:  # 4D
-                        chunk = vol[:, zs:ze, ys:ye, xs:xe]
-
-                fname = f"chunk_z{zi:02d}_y{yi:02d}_x{xi:02d}.tif"
-                out_path = os.path.join(save_path, fname)
-                tiff.imwrite(out_path, chunk)
-                chunk_idx += 1
-
-                print(f"[INFO] Saved {fname}, shape={chunk.shape}")
+    grid = [
+        (zi, yi, xi, zs, ze, ys, ye, xs, xe)
+        for zi, (zs, ze) in enumerate(z_ranges)
+        for yi, (ys, ye) in enumerate(y_ranges)
+        for xi, (xs, xe) in enumerate(x_ranges)
+    ]
+
+    def load(cell):
+        _, _, _, zs, ze, ys, ye, xs, xe = cell
+        if is_precomputed:
+            # CloudVolume expects (x,y,z)
+            bbox = np.s_[
+                xs:xe,
+                ys:ye,
+                zs:ze,
+            ]
+            # (Z,Y,X) ordering
+            # chunk = np.transpose(chunk, (2, 1, 0))
+            return np.asarray(vol[bbox])
+        if ndim == 3:
+            return vol[zs:ze, ys:ye, xs:xe]
+        return vol[:, zs:ze, ys:ye, xs:xe]  # 4D
+
+    def write(cell, chunk):
+        zi, yi, xi = cell[:3]
+        fname = f"chunk_z{zi:02d}_y{yi:02d}_x{xi:02d}.tif"
+        out_path = os.path.join(save_path, fname)
+        tiff.imwrite(out_path, chunk)
+
+        print(f"[INFO] Saved {fname}, shape={chunk.shape}")
+
+    # Chunk reads (remote for precomputed) overlap with TIFF writes
+    chunk_idx = run_pipeline(grid, load, lambda cell, chunk: chunk, write, workers=num_workers)
     print(f"\nDone. {chunk_idx} chunks saved to {save_path}")
 
 def main():
@@ -125,10 +134,10 @@ def main():
     chunk_size = [int(Fraction(val)) for val in chunk_size]
     overlap = [int(Fraction(val)) for val in overlap]
     mip = cfg["split"]["mip"]
-    _split_volume(input, output, chunk_size, overlap, mip)
+    _split_volume(input, output, chunk_size, overlap, mip, workers_from_cfg(cfg, "split"))
 
 
-def split_volume(cfg):
+def split_volume(cfg, workers=None):
     input = cfg["split"]["input"]
     output = cfg["split"]["output"]
     chunk_size = cfg["split"]["chunk_size"]
@@ -136,7 +145,7 @@ def split_volume(cfg):
     chunk_size = [int(Fraction(val)) for val in chunk_size]
     overlap = [int(Fraction(val)) for val in overlap]
     mip = cfg["split"]["mip"]
-    _split_volume(input, output, chunk_size, overlap, mip)
+    _split_volume(input, output, chunk_size, overlap, mip, workers_from_cfg(cfg, "split", workers))
     
 
 if __name__=="__main__":
@@ -1,6 +1,6 @@
-import os
 from pathlib import Path
-import yaml
+
+from magneton.yaml_cache import cached_yaml_load, load_global_yaml
 
 def _default_config_path() -> Path:
     # config.yaml in the configs directory
@@ -11,11 +11,12 @@ def _default_global_config_path() -> Path:
     return Path(__file__).with_name("magneton/config.yaml")
 
 
-def load_global_config_path(path: str = None):
+def load_global_config_path(path: str = None, use_cache: bool = True):
     """
     Load configuration path:
     - When path is None, read ./config.yaml
     - When path is a relative/absolute path, read the specified file
+    - Unless use_cache is False, reuse the in-process / temp dir parse while the file is unchanged
     """
     if path is None:
         cfg_path = _default_global_config_path()
@@ -27,8 +28,8 @@ def load_global_config_path(path: str = None):
             if maybe_pkg.is_file():
                 cfg_path = maybe_pkg
     # print(cfg_path)
-    with open(cfg_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_global_yaml(cfg_path, use_cache=use_cache)
+
 
 def load_config(path: str = None):
     """
@@ -45,6 +46,5 @@ def load_config(path: str = None):
             maybe_pkg = Path(__file__).resolve().parent / Path(path).name
             if maybe_pkg.is_file():
                 cfg_path = maybe_pkg
-    with open(cfg_path, "r") as f:
-        return yaml.safe_load(f)
+    return cached_yaml_load(cfg_path)
 
@@ -0,0 +1,114 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+_DONE = object()
+
+
+def workers_from_cfg(cfg, section, override=None, default=4):
+    """Worker count for a tool: ``override`` (the CLI's --workers) wins over the section's num_workers."""
+    return override or (cfg.get(section) or {}).get("num_workers", default)
+
+
+def run_pipeline(items, load, transform, write, workers=4, queue_size=None):
+    """
+    Run load -> transform -> write over ``items`` with one thread pool per step.
+
+    The steps are joined by bounded queues, so reading the next blocks overlaps
+    computing and writing the previous ones while at most ``queue_size`` blocks
+    wait between two steps.
+
+    Args:
+        items (iterable): Work items, e.g. block bounding boxes.
+        load (callable): load(item) -> data, or None to skip the item.
+        transform (callable): transform(item, data) -> result.
+        write (callable): write(item, result).
+        workers (int): Threads per step.
+        queue_size (int): Queue bound between steps, 2 * workers by default.
+
+    Returns:
+        int: Number of items written.
+    """
+    workers = max(1, int(workers))
+    queue_size = queue_size or 2 * workers
+    loaded = queue.Queue(maxsize=queue_size)
+    transformed = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    items = iter(items)
+    items_lock = threading.Lock()
+
+    def _put(q, value):
+        while not stop.is_set():
+            try:
+                q.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _guarded(step):
+        # Any failure stops the other steps instead of leaving them blocked on a queue
+        def worker():
+            try:
+                return step()
+            except BaseException:
+                stop.set()
+                raise
+        return worker
+
+    def load_step():
+        while not stop.is_set():
+            with items_lock:
+                item = next(items, _DONE)
+            if item is _DONE:
+                return
+            data = load(item)
+            if data is not None:
+                _put(loaded, (item, data))
+
+    def transform_step():
+        while True:
+            got = _get(loaded)
+            if got is _DONE:
+                return
+            item, data = got
+            _put(transformed, (item, transform(item, data)))
+
+    def write_step():
+        count = 0
+        while True:
+            got = _get(transformed)
+            if got is _DONE:
+                return count
+            write(*got)
+            count += 1
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="load") as load_pool, \
+            ThreadPoolExecutor(workers, thread_name_prefix="transform") as transform_pool, \
+            ThreadPoolExecutor(workers, thread_name_prefix="write") as write_pool:
+        loaders = [load_pool.submit(_guarded(load_step)) for _ in range(workers)]
+        transformers = [transform_pool.submit(_guarded(transform_step)) for _ in range(workers)]
+        writers = [write_pool.submit(_guarded(write_step)) for _ in range(workers)]
+        try:
+            # Each step is closed with one sentinel per downstream worker once its producers are done
+            wait(loaders)
+            for _ in range(workers):
+                _put(loaded, _DONE)
+            wait(transformers)
+            for _ in range(workers):
+                _put(transformed, _DONE)
+            wait(writers)
+        except BaseException:
+            stop.set()
+            raise
+
+    for f in loaders + transformers:
+        f.result()
+    return sum(f.result() for f in writers)
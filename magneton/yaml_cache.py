@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+YAML loading and the config caches shared by the instance segmentation and
+toolkit config modules, and by compile_config.
+"""
+
+import os
+import copy
+import functools
+import hashlib
+import logging
+import pickle
+import tempfile
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available, fall back to the pure-Python parser
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional; without it configs are always parsed from YAML
+    orjson = None
+
+if not getattr(yaml, "__with_libyaml__", False):
+    logging.getLogger(__name__).warning(
+        "PyYAML was built without libyaml; config parsing uses the slower pure-Python loader."
+    )
+
+# Parsed YAML keyed by (abs_path, st_mtime_ns, st_size); an edited file gets a new key.
+_YAML_CACHE = {}
+
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _read_sidecar(path, stamp):
+    """Return the config stored in the JSON sidecar of ``path`` if it was written for ``stamp``."""
+    try:
+        with open(str(path) + _SIDECAR_SUFFIX, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("source") != list(stamp):
+        return None
+    return data.get("config")
+
+
+def _write_sidecar(path, stamp, cfg):
+    """Best-effort write of a JSON sidecar; skipped when the config does not round-trip through JSON."""
+    try:
+        payload = orjson.dumps({"source": list(stamp), "config": cfg})
+        if orjson.loads(payload)["config"] != cfg:  # e.g. YAML dates would come back as strings
+            return
+        tmp_path = f"{path}{_SIDECAR_SUFFIX}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, str(path) + _SIDECAR_SUFFIX)
+    except (OSError, TypeError):
+        pass
+
+
+def cached_yaml_load(path):
+    """Parse a YAML file, reusing the previous result while the file is unchanged on disk."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (os.path.abspath(path),) + stamp
+    hit = _YAML_CACHE.get(key)
+    if hit is None and orjson is not None:
+        # Sidecar records the (mtime, size) it was built from, so any YAML edit invalidates it
+        hit = _read_sidecar(path, stamp)
+    if hit is None:
+        with open(path, "r") as f:
+            hit = yaml.load(f, Loader=SafeLoader)
+        if orjson is not None:
+            _write_sidecar(path, stamp, hit)
+    _YAML_CACHE[key] = hit
+    # Callers mutate the returned config, so never hand out the cached object itself
+    return copy.deepcopy(hit)
+
+def _pickle_cache_path(path):
+    """Per-user temp file for the parsed global config; one per config path, overwritten on change."""
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"magneton-cfg-{uid}-{digest}.pkl")
+
+
+def read_stamped_pickle(cache_path, source):
+    """Return the config of a ``{"source": ..., "config": ...}`` pickle if it was written for ``source``."""
+    try:
+        # The temp dir is shared, so only trust a pickle we wrote ourselves
+        if hasattr(os, "getuid") and os.stat(cache_path).st_uid != os.getuid():
+            return None
+        with open(cache_path, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if not isinstance(data, dict) or data.get("source") != list(source):
+        return None
+    return data.get("config")
+
+
+def write_stamped_pickle(cache_path, source, cfg):
+    """Atomically (over)write ``cache_path`` with ``cfg`` stamped with ``source``; best effort."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"source": list(source), "config": cfg}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _read_compiled_config(cfg_path, mtime_ns, size):
+    """Load the pickle written by `python -m magneton.compile_config` if it was built from this exact YAML."""
+    pkl_path = cfg_path + ".pkl"
+    try:
+        with open(pkl_path, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    # Exact (mtime_ns, size) like the sidecar: a ">= mtime" test misses edits on coarse-timestamp filesystems
+    if not isinstance(data, dict) or data.get("source") != [mtime_ns, size]:
+        logging.getLogger(__name__).warning(
+            "%s does not match %s; parsing YAML. Re-run `python -m magneton.compile_config`.",
+            pkl_path, cfg_path,
+        )
+        return None
+    return data.get("config")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_global_config(cfg_path, mtime_ns, size):
+    # mtime_ns/size are only part of the key, so an edited file misses the in-process cache too
+    cfg = _read_compiled_config(cfg_path, mtime_ns, size)
+    if cfg is not None:
+        return cfg
+    cache_path = _pickle_cache_path(cfg_path)
+    cfg = read_stamped_pickle(cache_path, [mtime_ns, size])
+    if cfg is None:
+        with open(cfg_path, "r") as f:
+            cfg = yaml.load(f, Loader=SafeLoader)
+        write_stamped_pickle(cache_path, [mtime_ns, size], cfg)
+    return cfg
+
+
+def load_global_yaml(cfg_path, use_cache=True):
+    """Parse the global config at ``cfg_path``; unless use_cache is False, reuse the cached parse while it is unchanged."""
+    if not use_cache:
+        with open(cfg_path, "r") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+    st = os.stat(cfg_path)
+    cfg = _parse_global_config(os.path.abspath(cfg_path), st.st_mtime_ns, st.st_size)
+    # Callers mutate the returned config, so never hand out the cached object itself
+    return copy.deepcopy(cfg)